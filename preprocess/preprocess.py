@@ -1,151 +1,162 @@
+import os
 import pandas as pd
 import numpy as np
 import re
-from difflib import SequenceMatcher
+from functools import lru_cache
+from rapidfuzz import fuzz, process
 from typing import Dict
 
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+WEIGHT_RE = re.compile(r'(\d+\.?\d*)\s*(g|kg|ml|l)\b', re.IGNORECASE)
+NAME_CLEAN_RE = re.compile(r'[^a-z0-9\s]')
+STOP_WORDS = frozenset({'the', 'and', 'or', 'of', 'in', 'on', 'for', 'with', 'a', 'an', 'to', 'but', 'by', 'from'})
+
+# Product names repeat across platforms and scrapes, so both helpers are memoized
+@lru_cache(maxsize=4096)
+def clean_product_name(name: str) -> str:
+    if pd.isna(name):
+        return ''
+    
+    name = str(name).lower()
+    # FIXED: Replace with space to avoid word concatenation
+    name = NAME_CLEAN_RE.sub(' ', name)
+    # Remove extra whitespace
+    name = ' '.join(name.split())
+    
+    return name
+
+@lru_cache(maxsize=4096)
+def extract_keywords(name: str) -> frozenset:
+    # name is already lowercased by clean_product_name
+    return frozenset(word for word in name.split() if len(word) > 2 and word not in STOP_WORDS)
+
 class DataPreprocessor:
     def __init__(self, df: pd.DataFrame):
-        self.df = df.copy()
+        self.df = df
         self.processed_df = None
         self.matched_products = None
         self.price_comparison = None
         
     def clean_data(self) -> pd.DataFrame:
-        df = self.df.copy()
-        
-        # Remove duplicates
-        df = df.drop_duplicates()
-        
-        # Handle brand
-        df['brand'] = df['brand'].fillna('Unknown')
-        df['brand'] = df['brand'].str.lower()
+        # Remove duplicates; self.df itself is never modified
+        df = self.df.drop_duplicates()
         
         # Clean price - FIXED: Remove rows with invalid prices BEFORE fillna
-        df['price_rupees'] = pd.to_numeric(df['price_rupees'], errors='coerce')
-        df = df[df['price_rupees'].notna() & (df['price_rupees'] > 0)]
+        price = pd.to_numeric(df['price_rupees'], errors='coerce')
+        
+        # Handle brand; the price filter then yields the frame owned by this step
+        df = df.assign(
+            brand=df['brand'].fillna('Unknown').str.lower(),
+            price_rupees=price
+        )[price.notna() & (price > 0)]
         
         # Handle URL
         df['url'] = df['url'].fillna('')
         
         # Clean weight - FIXED: Don't fillna(0) before extraction
         df['weight_grams'] = pd.to_numeric(df['weight_grams'], errors='coerce')
-        df['weight_grams'] = df.apply(
-            lambda row: self._extract_weight(row['pack_display'])
-            if pd.isna(row['weight_grams']) or row['weight_grams'] == 0 
-            else row['weight_grams'], axis=1
-        )
+        missing = df['weight_grams'].isna() | (df['weight_grams'] == 0)
+        df.loc[missing, 'weight_grams'] = self._extract_weight(df.loc[missing, 'pack_display'])
         
         # Standardize names
-        df['product_name_clean'] = df['product_name'].apply(self._clean_product_name)
+        df['product_name_clean'] = df['product_name'].map(clean_product_name)
         df['brand_clean'] = df['brand'].str.strip().str.title()
         
+        # Low-cardinality keys: groupby/unique then work on integer codes
+        for col in ('platform', 'brand_clean'):
+            df[col] = df[col].astype('category')
+        
         self.processed_df = df
         return df
     
-    def _extract_weight(self, pack_display: str) -> float:
-        if pd.isna(pack_display):
-            return np.nan
-        
+    def _extract_weight(self, pack_display: pd.Series) -> pd.Series:
         # Look for weight patterns
-        match = re.search(r'(\d+\.?\d*)\s*(g|kg|ml|l)\b', str(pack_display).lower(), re.IGNORECASE)
-        if match:
-            value = float(match.group(1))
-            unit = match.group(2).lower()
-            
-            # Convert to grams
-            if unit in ['kg', 'l']:
-                return value * 1000
-            else:
-                return value
-        return np.nan
-    
-    def _clean_product_name(self, name: str) -> str:
-        if pd.isna(name):
-            return ''
+        parts = pack_display.astype('string').str.lower().str.extract(WEIGHT_RE)
+        value = parts[0].astype(float)
         
-        name = str(name).lower()
-        # FIXED: Replace with space to avoid word concatenation
-        name = re.sub(r'[^a-z0-9\s]', ' ', name)
-        # Remove extra whitespace
-        name = ' '.join(name.split())
-        
-        return name
+        # Convert to grams
+        return value.where(~parts[1].isin(['kg', 'l']), value * 1000)
     
     def calculate_unit_price(self) -> pd.DataFrame:
-        df = self.processed_df.copy()
+        df = self.processed_df
         
-        df['price_per_100g'] = df.apply(
-            lambda row: (row['price_rupees'] / row['weight_grams'] * 100) 
-            if pd.notna(row['weight_grams']) and row['weight_grams'] > 0 
-            else np.nan, 
-            axis=1
-        )
+        df['price_per_100g'] = df['price_rupees'].div(df['weight_grams']).mul(100).where(df['weight_grams'] > 0)
         
         self.processed_df = df
         return df
 
-    def _similarity_score(self, str1: str, str2: str) -> float:
-        return SequenceMatcher(None, str1, str2).ratio()
-    
-    def _extract_keywords(self, name: str) -> set:
-        stop_words = {'the', 'and', 'or', 'of', 'in', 'on', 'for', 'with', 'a', 'an', 'to', 'but', 'by', 'from'}
-        words = name.lower().split()
-        keywords = {word for word in words if word not in stop_words and len(word) > 2}
-        return keywords
+    def _similarity_matrix(self, names: np.ndarray) -> np.ndarray:
+        return process.cdist(names, names, scorer=fuzz.ratio, dtype=np.float64, workers=-1) / 100.0
     
     def match_products(self, threshold: float = 0.7, brand_match_req: bool = True) -> pd.DataFrame:
-        df = self.processed_df.copy()
+        df = self.processed_df
         matches = []
         
-        for brand in df['brand_clean'].unique():
-            brand_df = df[df['brand_clean'] == brand]
-            platforms = brand_df['platform'].unique()
+        # One split of the frame instead of a boolean mask scan per brand
+        for brand, brand_df in df.groupby('brand_clean', sort=False, observed=True):
+            if brand_df['platform'].nunique() < 2:
+                continue
             
-            if len(platforms) < 2:
+            # Every brand_df row shares brand_clean, so brand_match_req always holds here
+            cols = {col: brand_df[col].to_numpy() for col in (
+                'product_name', 'product_name_clean', 'platform',
+                'price_rupees', 'price_per_100g', 'url'
+            )}
+            cols['weight_grams'] = brand_df['weight_grams'].to_numpy(dtype=np.float64)
+            
+            # Candidate pairs (i < j) on different platforms
+            idx1, idx2 = np.triu_indices(len(brand_df), k=1)
+            keep = cols['platform'][idx1] != cols['platform'][idx2]
+            
+            # Weight matching before the costlier string similarity
+            w1 = cols['weight_grams'][idx1]
+            w2 = cols['weight_grams'][idx2]
+            with np.errstate(invalid='ignore', divide='ignore'):
+                weight_match = np.abs(w1 - w2) / np.maximum(w1, w2) < 0.1
+            keep &= weight_match | np.isnan(w1)
+            
+            # Duplicate listings share a cleaned name, so score each distinct name pair once
+            unique_names, name_idx = np.unique(cols['product_name_clean'], return_inverse=True)
+            similarity = self._similarity_matrix(unique_names)
+            
+            # Keyword matching: shared-keyword counts from a name x keyword incidence matrix
+            keyword_sets = [extract_keywords(name) for name in unique_names]
+            vocab = {word: k for k, word in enumerate(frozenset().union(*keyword_sets))}
+            incidence = np.zeros((len(unique_names), len(vocab)), dtype=np.int64)
+            for row, words in enumerate(keyword_sets):
+                incidence[row, [vocab[word] for word in words]] = 1
+            sizes = incidence.sum(axis=1)
+            keyword_overlap = (incidence @ incidence.T) / np.maximum(np.maximum.outer(sizes, sizes), 1)
+            
+            combined = (similarity * 0.6) + (keyword_overlap * 0.4)
+            
+            idx1, idx2 = idx1[keep], idx2[keep]
+            scores = combined[name_idx[idx1], name_idx[idx2]]
+            hit = scores >= threshold
+            if not hit.any():
                 continue
+            i, j = idx1[hit], idx2[hit]
             
-            for i, row1 in brand_df.iterrows():
-                for j, row2 in brand_df.iterrows():
-                    if i >= j or row1['platform'] == row2['platform']:
-                        continue
-                    
-                    if brand_match_req and row1['brand_clean'] != row2['brand_clean']:
-                        continue
-                    
-                    # Calculate similarity
-                    sim_score = self._similarity_score(row1['product_name_clean'], row2['product_name_clean'])
-                    
-                    # Keyword matching
-                    keywords1 = self._extract_keywords(row1['product_name_clean'])
-                    keywords2 = self._extract_keywords(row2['product_name_clean'])
-                    keyword_overlap = len(keywords1 & keywords2) / max(len(keywords1), len(keywords2), 1)
-                    
-                    combined_score = (sim_score * 0.6) + (keyword_overlap * 0.4)
-                    
-                    # Weight matching
-                    weight_match = False 
-                    if pd.notna(row1['weight_grams']) and pd.notna(row2['weight_grams']):
-                        weight_diff = abs(row1['weight_grams'] - row2['weight_grams'])
-                        weight_match = weight_diff / max(row1['weight_grams'], row2['weight_grams']) < 0.1
-                    
-                    if combined_score >= threshold and (weight_match or pd.isna(row1['weight_grams'])):
-                        matches.append({
-                            'product_name': row1['product_name'],
-                            'brand': row1['brand_clean'],
-                            'weight_grams': row1['weight_grams'],
-                            'platform_1': row1['platform'],
-                            'price_1': row1['price_rupees'],
-                            'price_per_100g_1': row1['price_per_100g'],
-                            'url_1': row1['url'],
-                            'platform_2': row2['platform'],
-                            'price_2': row2['price_rupees'],
-                            'price_per_100g_2': row2['price_per_100g'],
-                            'url_2': row2['url'],
-                            'similarity_score': combined_score
-                        })
-        
-        self.matched_products = pd.DataFrame(matches)
+            matches.append(pd.DataFrame({
+                'product_name': cols['product_name'][i],
+                'brand': brand,
+                'weight_grams': cols['weight_grams'][i],
+                'platform_1': cols['platform'][i],
+                'price_1': cols['price_rupees'][i],
+                'price_per_100g_1': cols['price_per_100g'][i],
+                'url_1': cols['url'][i],
+                'platform_2': cols['platform'][j],
+                'price_2': cols['price_rupees'][j],
+                'price_per_100g_2': cols['price_per_100g'][j],
+                'url_2': cols['url'][j],
+                'similarity_score': scores[hit]
+            }))
+        
+        self.matched_products = pd.concat(matches, ignore_index=True) if matches else pd.DataFrame()
         return self.matched_products
     
     def compare_prices(self) -> pd.DataFrame:
@@ -153,24 +164,35 @@ class DataPreprocessor:
             print("No matched products found.")
             return pd.DataFrame()
         
-        df = self.matched_products.copy()
-        
-        # Calculate differences
-        df['price_diff'] = df['price_2'] - df['price_1']
-        df['price_diff_pct'] = (df['price_diff'] / df[['price_1', 'price_2']].min(axis=1)) * 100
+        matched = self.matched_products
         
-        df['unit_price_diff'] = df['price_per_100g_2'] - df['price_per_100g_1']
-        df['unit_price_diff_pct'] = (df['unit_price_diff'] / df[['price_per_100g_1', 'price_per_100g_2']].min(axis=1)) * 100
+        price_1 = matched['price_1'].to_numpy(dtype=float)
+        price_2 = matched['price_2'].to_numpy(dtype=float)
+        unit_1 = matched['price_per_100g_1'].to_numpy(dtype=float)
+        unit_2 = matched['price_per_100g_2'].to_numpy(dtype=float)
+        # fmin skips NaN like DataFrame.min(axis=1)
+        best_price = np.fmin(price_1, price_2)
         
-        # Identify cheaper platform
-        df['cheaper_platform'] = df.apply(
-            lambda row: row['platform_1'] if row['price_1'] < row['price_2'] else row['platform_2'], 
-            axis=1
+        # Calculate differences
+        price_diff = price_2 - price_1
+        unit_price_diff = unit_2 - unit_1
+        
+        # matched_products is exported as-is, so the new columns go on a new frame
+        df = matched.assign(
+            price_diff=price_diff,
+            price_diff_pct=(price_diff / best_price) * 100,
+            unit_price_diff=unit_price_diff,
+            unit_price_diff_pct=(unit_price_diff / np.fmin(unit_1, unit_2)) * 100,
+            # Identify cheaper platform
+            cheaper_platform=np.where(
+                price_1 < price_2,
+                matched['platform_1'].to_numpy(),
+                matched['platform_2'].to_numpy()
+            ),
+            best_price=best_price,
+            savings=np.abs(price_diff),
         )
         
-        df['best_price'] = df[['price_1', 'price_2']].min(axis=1)
-        df['savings'] = abs(df['price_diff'])
-        
         # Sort by savings
         df = df.sort_values(by='savings', ascending=False)
         
@@ -178,64 +200,61 @@ class DataPreprocessor:
         return df
     
     def get_platform_summary(self) -> pd.DataFrame:
-        df = self.processed_df.copy()
-        
-        # FIXED: Updated aggregation to match column renaming
-        summary = df.groupby('platform').agg({
-            'product_name': 'nunique',
-            'price_rupees': ['mean', 'median', 'min', 'max'],
-            'price_per_100g': ['mean', 'median']
-        }).round(2)
-
-        summary.columns = ['_'.join(col).strip() for col in summary.columns]
-        summary = summary.rename(columns={
-            'product_name_nunique': 'total_products',
-            'price_rupees_mean': 'avg_price',
-            'price_rupees_median': 'median_price',
-            'price_rupees_min': 'min_price',
-            'price_rupees_max': 'max_price',
-            'price_per_100g_mean': 'avg_price_per_100g',
-            'price_per_100g_median': 'median_price_per_100g'
-        })
+        df = self.processed_df
+        
+        summary = df.groupby('platform', observed=True).agg(
+            total_products=('product_name', 'nunique'),
+            avg_price=('price_rupees', 'mean'),
+            median_price=('price_rupees', 'median'),
+            min_price=('price_rupees', 'min'),
+            max_price=('price_rupees', 'max'),
+            avg_price_per_100g=('price_per_100g', 'mean'),
+            median_price_per_100g=('price_per_100g', 'median'),
+        ).round(2)
 
         return summary.reset_index()
     
     def get_brand_summary(self) -> pd.DataFrame:
-        df = self.processed_df.copy()
-        
-        summary = df.groupby('brand_clean').agg({
-            'product_name': 'nunique',
-            'platform': lambda x: x.nunique(),
-            'price_rupees': 'mean',
-            'price_per_100g': 'mean',
-        }).round(2)
+        df = self.processed_df
+        
+        summary = df.groupby('brand_clean', observed=True).agg(
+            product_count=('product_name', 'nunique'),
+            platforms_available=('platform', 'nunique'),
+            avg_price=('price_rupees', 'mean'),
+            avg_price_per_100g=('price_per_100g', 'mean'),
+        ).round(2)
 
-        summary.columns = ['product_count', 'platforms_available', 'avg_price', 'avg_price_per_100g']
         summary = summary.sort_values('product_count', ascending=False)
                 
         return summary.reset_index()
     
-    def export_for_dashboard(self, output_prefix: str='processed'):
-        """Export all processed data to CSV files"""
+    def _write_table(self, df: pd.DataFrame, name: str, format: str):
+        if format == 'parquet':
+            df.to_parquet(f'data/{name}.parquet', compression='zstd', index=False)
+        else:
+            df.to_csv(f'data/{name}.csv', index=False)
+            # The dashboard prefers Parquet, so drop any copy left by an earlier export
+            if os.path.exists(f'data/{name}.parquet'):
+                os.remove(f'data/{name}.parquet')
+        print(f"✓ Exported: {name}.{format}")
+
+    def export_for_dashboard(self, output_prefix: str='processed', format: str='parquet'):
+        """Export all processed data as Parquet (or CSV) files"""
+        if format == 'parquet' and pyarrow is None:
+            print("pyarrow is not installed, exporting CSV instead")
+            format = 'csv'
+        
         if self.processed_df is not None:
-            self.processed_df.to_csv(f'data/{output_prefix}_products.csv', index=False)
-            print(f"✓ Exported: {output_prefix}_products.csv")
+            self._write_table(self.processed_df, f'{output_prefix}_products', format)
             
         if self.matched_products is not None and len(self.matched_products) > 0:
-            self.matched_products.to_csv(f'data/{output_prefix}_matched.csv', index=False)
-            print(f"✓ Exported: {output_prefix}_matched.csv")
+            self._write_table(self.matched_products, f'{output_prefix}_matched', format)
             
         if self.price_comparison is not None and len(self.price_comparison) > 0:
-            self.price_comparison.to_csv(f'data/{output_prefix}_price_comparison.csv', index=False)
-            print(f"✓ Exported: {output_prefix}_price_comparison.csv")
+            self._write_table(self.price_comparison, f'{output_prefix}_price_comparison', format)
             
-        platform_summary = self.get_platform_summary()
-        platform_summary.to_csv(f'data/{output_prefix}_platform_summary.csv', index=False)
-        print(f"✓ Exported: {output_prefix}_platform_summary.csv")
-        
-        brand_summary = self.get_brand_summary()
-        brand_summary.to_csv(f'data/{output_prefix}_brand_summary.csv', index=False)
-        print(f"✓ Exported: {output_prefix}_brand_summary.csv")
+        self._write_table(self.get_platform_summary(), f'{output_prefix}_platform_summary', format)
+        self._write_table(self.get_brand_summary(), f'{output_prefix}_brand_summary', format)
         
         print("\n✓ All files exported successfully!")
 
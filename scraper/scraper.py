@@ -1,8 +1,14 @@
 # bread_scraper_fixed.py
 import re
 import os
+import csv
+import argparse
+import json
 import time
-from dataclasses import dataclass, asdict
+import hashlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from dataclasses import dataclass, fields
 from typing import List, Dict, Optional, Tuple
 
 import pandas as pd
@@ -11,6 +17,7 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException
 
 
 BRANDS = [
@@ -32,10 +39,125 @@ NON_BREAD_EXCLUDE = [
     "storage box","tin","mould","pan","tray","maker","cutter","improver",
 ]
 
+# Substring tests against each term list as single C-level scans. The brand
+# scan is a lookahead so every start position is reported, which lets
+# extract_brand prefer the longest brand found over short ones like "id"
+# that also occur inside ordinary words.
+BREAD_TERMS_RE = re.compile("|".join(map(re.escape, BREAD_TERMS)))
+NON_BREAD_RE = re.compile("|".join(map(re.escape, NON_BREAD_EXCLUDE)))
+BRANDS_BY_LEN = sorted(BRAND_CANON, key=len, reverse=True)
+BRAND_SCAN_RE = re.compile("(?=(" + "|".join(map(re.escape, BRANDS_BY_LEN)) + "))")
+BRAND_RANK = {b: i for i, b in enumerate(BRANDS_BY_LEN)}
+
 NUM_RE = re.compile(r"\d+(?:\.\d+)?")
 
 PRICE_RE = re.compile(r"₹\s*([0-9][0-9,]*)(?:\.(\d{1,2}))?")
-WEIGHT_RE = re.compile(r"\b(\d+(?:\.\d+)?)\s*(kg|g|l|ml|pc|pcs|pieces|slice|slices)\b", re.IGNORECASE)
+WEIGHT_RE = re.compile(r"\b(?P<val>\d+(?:\.\d+)?)\s*(?P<unit>kg|g|l|ml|pc|pcs|pieces|slice|slices)\b", re.IGNORECASE)
+# "180 g x 2" multipacks and plain weights in a single scan; only the unit
+# of the weight branch is case-insensitive, as in WEIGHT_RE
+PACK_RE = re.compile(
+    r"(?P<per>\d+(?:\.\d+)?)\s*g\s*[xX]\s*(?P<count>\d+)"
+    r"|\b(?P<val>\d+(?:\.\d+)?)\s*(?P<unit>(?i:kg|g|l|ml|pc|pcs|pieces|slice|slices))\b"
+)
+# PACK_RE plus prices in the same pass. The price branch only consumes the "₹"
+# so the digits after it can still be read as a weight, as separate searches would.
+RECORD_RE = re.compile(PACK_RE.pattern + r"|₹(?=\s*(?P<whole>[0-9]+)(?:\.(?P<frac>\d{1,2}))?)")
+PACK_TEXT_RE = re.compile(r"(\d+\s*(?:g|kg|ml|l)|\d+\s*(?:pc|pcs|pieces|slice|slices)|\d+\s*g\s*[xX]\s*\d+)", re.IGNORECASE)
+# Lines clean_name_lines drops: "Add"/"Save..." buttons, "premium" badges,
+# prices, bare counts like "4.2k", discounts and bracketed notes
+REJECT_RE = re.compile(r"^add$|^save|premium|₹|%|^\d+(?:\.\d+)?k?$|^(?=.*\()(?=.*\))", re.IGNORECASE)
+
+ZEPTO_URL = "https://www.zeptonow.com/search?query=bread"
+JIOMART_URL = "https://www.jiomart.com/search/bread"
+AMAZON_FRESH_URL = "https://www.amazon.in/s?k=bread&i=fresh&rh=n%3A21862203031"
+
+ZEPTO_CARD_XPATHS = [
+    "//div[contains(@class,'styles_container') and .//img[@alt]]",
+    "//a[contains(@href,'/pn/')]",
+    "//div[contains(@class,'product-card')]",
+]
+JIOMART_TILE_SELECTOR = "[id*='product'], .product-tile, .ais-InfiniteHits-item"
+AMAZON_TILE_SELECTOR = "[data-component-type='s-search-result']"
+
+# Only text is scraped, so heavy subresources are never fetched. Stylesheets
+# stay enabled because innerText line breaks depend on the computed layout.
+BLOCKED_URLS = [
+    "*.jpg", "*.jpeg", "*.png", "*.webp", "*.gif", "*.svg", "*.avif",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.mp4", "*.webm",
+]
+
+# Tile fields are read in one execute_script call per page instead of a
+# WebDriver round-trip per element lookup
+ZEPTO_CARDS_JS = """
+var cards = [];
+for (var i = 0; i < arguments[0].length && cards.length <= 60; i++) {
+    var snap = document.evaluate(arguments[0][i], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (var k = 0; k < snap.snapshotLength; k++) {
+        cards.push(snap.snapshotItem(k));
+    }
+}
+return cards.slice(0, 120).map(function (c) {
+    var link = document.evaluate(".//a[contains(@href,'/pn/')]", c, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    var img = c.querySelector("img[alt]");
+    return [c.innerText || "", img ? img.getAttribute("alt") : null, link ? link.href : null];
+});
+"""
+
+# Scrolls to the bottom up to arguments[0] times, each time waiting at most
+# arguments[1] seconds for appended results to grow the page; stops at the
+# first round that adds nothing. Runs entirely in the page.
+SCROLL_JS = """
+var done = arguments[arguments.length - 1];
+var wait = arguments[1] * 1000;
+var last = document.body.scrollHeight;
+function round(left) {
+    if (left <= 0) {
+        return done();
+    }
+    var timer;
+    var observer = new MutationObserver(function () {
+        if (document.body.scrollHeight > last) {
+            observer.disconnect();
+            clearTimeout(timer);
+            last = document.body.scrollHeight;
+            round(left - 1);
+        }
+    });
+    observer.observe(document.body, {childList: true, subtree: true, attributes: true});
+    timer = setTimeout(function () {
+        observer.disconnect();
+        done();
+    }, wait);
+    window.scrollTo(0, document.body.scrollHeight);
+}
+round(arguments[0]);
+"""
+
+JIOMART_TILES_JS = """
+return Array.from(document.querySelectorAll(arguments[0])).slice(0, 120).map(function (t) {
+    var name = t.querySelector(".product-name, .jm-body-xs, [class*='title']");
+    var link = t.querySelector("a");
+    return [t.innerText || "", name ? name.innerText : null, link ? link.href : null];
+});
+"""
+
+AMAZON_TILES_JS = """
+return Array.from(document.querySelectorAll(arguments[0])).slice(0, 120).map(function (t) {
+    var name = t.querySelector("h2 a span, .a-text-normal");
+    var off = t.querySelector(".a-price .a-offscreen");
+    var whole = t.querySelector(".a-price-whole");
+    var frac = t.querySelector(".a-price-fraction");
+    var link = t.querySelector("h2 a");
+    return [
+        t.innerText || "",
+        name ? name.innerText : null,
+        off ? off.innerText : null,
+        whole ? whole.innerText : null,
+        frac ? frac.innerText : null,
+        link ? link.href : null
+    ];
+});
+"""
 
 @dataclass
 class Product:
@@ -49,6 +171,41 @@ class Product:
     weight_grams: Optional[float]
     url: Optional[str] = None
 
+    def to_tuple(self) -> Tuple:
+        # field order of PRODUCT_COLUMNS, without asdict's deep copy
+        return (self.platform, self.product_name, self.brand, self.pack_display, self.price_rupees,
+                self.qty, self.unit, self.weight_grams, self.url)
+
+PRODUCT_COLUMNS = [f.name for f in fields(Product)]
+
+# Raw tile payloads per search URL; a fresh entry skips the browser entirely.
+# Off unless requested (scraper.py --cache), so a normal run always fetches.
+CACHE_DIR = os.path.join("data", "cache")
+CACHE_TTL = 30 * 60
+
+def cache_path(url: str) -> str:
+    return os.path.join(CACHE_DIR, hashlib.sha1(url.encode("utf-8")).hexdigest() + ".json")
+
+def load_cached_tiles(url: str, ttl: float):
+    if ttl <= 0:
+        return None
+    path = cache_path(url)
+    try:
+        if time.time() - os.path.getmtime(path) >= ttl:
+            return None
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def save_cached_tiles(url: str, tiles) -> None:
+    # an empty payload is a blocked or timed-out load, never worth replaying
+    if not tiles:
+        return
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(cache_path(url), "w", encoding="utf-8") as f:
+        json.dump(tiles, f)
+
 def setup_driver(headless=True):
     options = Options()
     if headless:
@@ -60,10 +217,20 @@ def setup_driver(headless=True):
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
     options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    # background services a scraping session never uses
+    for arg in ("--disable-background-networking", "--disable-sync", "--disable-default-apps",
+                "--disable-features=Translate,MediaRouter,OptimizationHints,InterestFeedContentSuggestions",
+                "--metrics-recording-only", "--mute-audio", "--no-first-run", "--disable-notifications"):
+        options.add_argument(arg)
+    # driver.get returns at DOMContentLoaded; scrapers wait for their own selectors
+    options.page_load_strategy = "eager"
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
     options.add_experimental_option("useAutomationExtension", False)
     options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36")
     driver = webdriver.Chrome(options=options)
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
     driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
         "source": """
             Object.defineProperty(navigator, 'webdriver', { get: () => undefined })
@@ -71,33 +238,21 @@ def setup_driver(headless=True):
     })
     return driver
 
+@lru_cache(maxsize=4096)
 def is_bread_like(text: str) -> bool:
     t = (text or "").lower()
-    if any(x in t for x in NON_BREAD_EXCLUDE):
+    if NON_BREAD_RE.search(t):
         return False
-    return any(term in t for term in BREAD_TERMS)
+    return BREAD_TERMS_RE.search(t) is not None
 
 def clean_name_lines(block: str) -> str:
-    lines = [ln.strip() for ln in (block or "").split("\n") if ln.strip()]
-    cleaned = []
-    for ln in lines:
-        low = ln.lower()
-        if low == "add" or low.startswith("save") or "premium" in low:
-            continue
-        if "₹" in ln:
-            continue
-        if re.fullmatch(r"\d+(\.\d+)?k?", low):
-            continue
-        if "%" in ln or ("(" in ln and ")" in ln):
-            continue
-        if len(ln) < 4:
-            continue
-        cleaned.append(ln)
+    cleaned = [ln for ln in map(str.strip, (block or "").split("\n")) if len(ln) >= 4 and not REJECT_RE.search(ln)]
     for ln in cleaned:
         if is_bread_like(ln):
             return ln
     return max(cleaned, key=len) if cleaned else ""
 
+@lru_cache(maxsize=4096)
 def parse_price(text: str):
     if not text:
         return None
@@ -114,15 +269,28 @@ def parse_price(text: str):
 def parse_pack(text: str):
     if not text:
         return None, None, None, None
+    m = x_match = None
+    for hit in PACK_RE.finditer(text):
+        if hit.group("per") is None:
+            if m is None:
+                m = hit
+            continue
+        x_match = hit
+        if m is None:
+            # the multipack swallowed the first weight, e.g. the "180 g" of "180 g x 2"
+            m = WEIGHT_RE.search(text, hit.start())
+        break
+    return pack_fields(m, x_match)
+
+def pack_fields(m, x_match):
     pack_display = None
     qty = None
     unit = None
     grams = None
     # canonical display
-    m = WEIGHT_RE.search(text)
     if m:
-        val = float(m.group(1))
-        u = m.group(2).lower()
+        val = float(m.group("val"))
+        u = m.group("unit").lower()
         pack_display = f"{int(val) if val.is_integer() else val} {u}"
         if u == "kg":
             grams = val * 1000
@@ -135,27 +303,57 @@ def parse_pack(text: str):
             qty = val
             unit = "slices"
     # patterns like "180 g X 2"
-    x_match = re.search(r"(\d+(?:\.\d+)?)\s*g\s*[xX]\s*(\d+)", text)
     if x_match:
-        per = float(x_match.group(1)); count = float(x_match.group(2))
+        per = float(x_match.group("per")); count = float(x_match.group("count"))
         grams = per * count
         pack_display = f"{int(per) if per.is_integer() else per} g x {int(count)}"
     return pack_display, qty, unit, grams
 
+def hit_price(hit) -> Optional[float]:
+    if hit is None:
+        return None
+    return float(f"{hit.group('whole')}.{hit.group('frac') or '00'}")
+
+def scan_record(name: str, block_text: str):
+    # pack fields of "name\nblock" and the first price of the block (else of
+    # the name), equivalent to parse_pack plus two parse_price calls
+    text = f"{name}\n{block_text}"
+    if "," in text:
+        # parse_price drops thousands separators before matching
+        return parse_pack(text) + (parse_price(block_text) or parse_price(name),)
+    split = len(str(name))
+    m = x_match = name_price = block_price = None
+    for hit in RECORD_RE.finditer(text):
+        if hit.group("whole") is not None:
+            if hit.start() > split:
+                block_price = block_price or hit
+            elif hit.start("whole") < split:
+                name_price = name_price or hit
+            continue
+        if x_match is not None:
+            continue
+        if hit.group("per") is None:
+            if m is None:
+                m = hit
+            continue
+        x_match = hit
+        if m is None:
+            m = WEIGHT_RE.search(text, hit.start())
+    return pack_fields(m, x_match) + (hit_price(block_price) or hit_price(name_price),)
+
+@lru_cache(maxsize=4096)
 def extract_brand(name: str) -> str:
     n = (name or "").strip()
-    parts = n.split()
-    first_two = " ".join(parts[:2]).lower()
-    first_three = " ".join(parts[:3]).lower()
-    for key in [first_three, first_two, (parts[0].lower() if parts else "")]:
+    low = n.lower()
+    words = low.split()
+    for key in (" ".join(words[:3]), " ".join(words[:2]), (words[0] if words else "")):
         if key in BRAND_CANON:
             return BRAND_CANON[key]
-    low = n.lower()
-    for b in BRAND_CANON:
-        if b in low:
-            return BRAND_CANON[b]
-    if parts and parts[0].lower() not in ["add","save","premium","filters","the"]:
-        return parts[0].capitalize()
+    hits = BRAND_SCAN_RE.findall(low)
+    if hits:
+        return BRAND_CANON[min(hits, key=BRAND_RANK.__getitem__)]
+    if words and words[0] not in ("add","save","premium","filters","the"):
+        return n.split()[0].capitalize()
     return "Unknown"
 
 def normalize_record(platform: str, name: str, block_text: str, href: Optional[str]) -> Optional[Product]:
@@ -165,11 +363,10 @@ def normalize_record(platform: str, name: str, block_text: str, href: Optional[s
     if not is_bread_like(pname):
         return None
     brand = extract_brand(pname)
-    pack_display, qty, unit, grams = parse_pack(f"{name}\n{block_text}")
-    price = parse_price(block_text) or parse_price(name)
+    pack_display, qty, unit, grams, price = scan_record(name, block_text)
 
     # Try to preserve a readable pack string
-    pack_match = re.search(r"(\d+\s*(?:g|kg|ml|l)|\d+\s*(?:pc|pcs|pieces|slice|slices)|\d+\s*g\s*[xX]\s*\d+)", f"{name} {block_text}", re.IGNORECASE)
+    pack_match = PACK_TEXT_RE.search(f"{name} {block_text}")
     if pack_match:
         pack_display = pack_match.group(1)
 
@@ -185,246 +382,270 @@ def normalize_record(platform: str, name: str, block_text: str, href: Optional[s
         url=href,
     )
 
-class BreadScraper:
-    def __init__(self, headless=True):
-        self.headless = headless
-        self.results: List[Product] = []
-
-    def wait_dom(self, driver, timeout=15):
-        WebDriverWait(driver, timeout).until(lambda d: d.execute_script("return document.readyState") == "complete")
-
-    def scroll(self, driver, rounds=4, pause=0.8):
-        last_h = 0
-        for _ in range(rounds):
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(pause)
-            h = driver.execute_script("return document.body.scrollHeight;")
-            if h == last_h:
+def parse_zepto_tiles(containers) -> List[Product]:
+    out: List[Product] = []
+    seen_keys = set()
+    for txt, name, href in containers:
+        try:
+            txt = txt.strip()
+            if len(txt) < 8:
+                continue
+            # prefer image alt as name; fallback to cleaned text
+            name = name or ""
+            if not name:
+                name = clean_name_lines(txt)
+            prod = normalize_record("Zepto", name, txt, href)
+            if not prod:
+                continue
+            key = (prod.product_name.lower(), prod.brand.lower(), int(prod.weight_grams) if prod.weight_grams else 0)
+            if key in seen_keys:
+                continue
+            seen_keys.add(key)
+            out.append(prod)
+            if len(out) >= 80:
                 break
-            last_h = h
-    
-    def _dedupe(self, items):
-        seen = set(); out = []
-        for p in items:
-            key = (p["platform"], p["product_name"].lower(), (p["brand"] or "").lower(), int(p["weight_grams"] or 0))
+        except:
+            continue
+    return out
+
+def parse_jiomart_tiles(tiles) -> List[Product]:
+    out: List[Product] = []
+    seen = set()
+    for block, name, href in tiles:
+        try:
+            block = block.strip()
+            if not block:
+                continue
+            # name
+            name = name.strip() if name is not None else clean_name_lines(block)
+            if not name:
+                continue
+            # filter accessories
+            if not is_bread_like(name):
+                continue
+            prod = normalize_record("JioMart", name, block, href)
+            if not prod:
+                continue
+            key = (prod.product_name.lower(), prod.brand.lower(), int(prod.weight_grams) if prod.weight_grams else 0)
             if key in seen:
                 continue
-            seen.add(key); out.append(p)
-        return out
+            seen.add(key)
+            out.append(prod)
+            if len(out) >= 80:
+                break
+        except:
+            continue
+    return out
 
-    def scrape_zepto(self, url="https://www.zeptonow.com/search?query=bread") -> List[Product]:
-        out: List[Product] = []
-        driver = None
+def parse_amazon_fresh_tiles(tiles) -> List[Product]:
+    out: List[Product] = []
+    seen = set()
+    for block, name, off, whole, frac, href in tiles:
         try:
-            driver = setup_driver(self.headless)
-            driver.get("https://www.zeptonow.com/")
-            time.sleep(3)
-            # try location
-            try:
-                loc = WebDriverWait(driver, 8).until(
-                    EC.presence_of_element_located((By.XPATH, "//input[contains(@placeholder,'location') or contains(@placeholder,'address')]"))
-                )
-                loc.clear()
-                loc.send_keys("Connaught Place, New Delhi, Delhi 110001")
-                time.sleep(2)
-                try:
-                    WebDriverWait(driver,5).until(
-                        EC.element_to_be_clickable((By.XPATH, "//div[contains(@class,'suggestion')]//div[1]"))
-                    ).click()
-                except:
-                    from selenium.webdriver.common.keys import Keys
-                    loc.send_keys(Keys.RETURN)
-                time.sleep(2)
-            except:
-                pass
-
-            driver.get(url)
-            self.wait_dom(driver, 20)
-            self.scroll(driver, 6, 1.0)
-
-            containers = []
-            for xp in [
-                "//div[contains(@class,'styles_container') and .//img[@alt]]",
-                "//a[contains(@href,'/pn/')]",
-                "//div[contains(@class,'product-card')]",
-            ]:
-                try:
-                    containers.extend(driver.find_elements(By.XPATH, xp))
-                    if len(containers) > 60:
-                        break
-                except:
-                    continue
+            block = block.strip()
+            name = name.strip() if name is not None else block
+            if not name or not is_bread_like(name):
+                continue
+            # prefer offscreen price
+            price_txt = ""
+            if off is not None:
+                price_txt = off
+            elif whole is not None:
+                price_txt = f"₹{whole}.{frac if frac is not None else '00'}"
+            prod = normalize_record("Amazon Fresh", name, f"{block}\n{price_txt}", href)
+            if not prod:
+                continue
+            key = (prod.product_name.lower(), prod.brand.lower(), int(prod.weight_grams) if prod.weight_grams else 0)
+            if key in seen:
+                continue
+            seen.add(key)
+            out.append(prod)
+            if len(out) >= 80:
+                break
+        except:
+            continue
+    return out
+
+class BreadScraper:
+    def __init__(self, headless=True, cache_ttl=0):
+        self.headless = headless
+        # seconds a cached page payload stays valid; 0 disables the cache
+        self.cache_ttl = cache_ttl
+        self.results: List[Product] = []
+        self._driver = None
+
+    def _get_driver(self):
+        # Started on first use and kept for the scraper's lifetime; see close().
+        # Only the sequential scrape_all(parallel=False) path uses it.
+        if self._driver is None:
+            self._driver = setup_driver(self.headless)
+        return self._driver
+
+    def reset(self):
+        # for long-lived processes: drop results and the memoized parser state
+        self.results = []
+        for parser in (is_bread_like, parse_price, extract_brand):
+            parser.cache_clear()
+
+    def close(self):
+        if self._driver is not None:
+            self._driver.quit()
+            self._driver = None
+
+    def wait_for(self, driver, locator, timeout=20):
+        # Proceed as soon as the first product card exists instead of waiting
+        # for every subresource of the page to finish loading
+        WebDriverWait(driver, timeout).until(EC.presence_of_element_located(locator))
+
+    def scroll(self, driver, rounds=4, timeout=0.8):
+        # Move on as soon as more results are appended; stop once a round adds none.
+        # One async script call instead of a round-trip per height poll.
+        driver.execute_async_script(SCROLL_JS, rounds, timeout)
+    
+    def scrape_zepto(self, url=ZEPTO_URL, driver=None) -> List[Product]:
+        return parse_zepto_tiles(self.fetch_zepto(url, driver))
 
-            seen_keys = set()
-            for c in containers[:120]:
+    def fetch_zepto(self, url=ZEPTO_URL, driver=None) -> list:
+        own_driver = driver is None
+        try:
+            containers = load_cached_tiles(url, self.cache_ttl)
+            if containers is None:
+                if own_driver:
+                    driver = setup_driver(self.headless)
+                driver.get("https://www.zeptonow.com/")
+                # try location
                 try:
-                    txt = (c.text or "").strip()
-                    if len(txt) < 8:
-                        continue
-                    try:
-                        a = c.find_element(By.XPATH, ".//a[contains(@href,'/pn/')]")
-                        href = a.get_attribute("href")
-                    except:
-                        href = None
-                    # prefer image alt as name; fallback to cleaned text
-                    name = ""
+                    loc = WebDriverWait(driver, 8).until(
+                        EC.presence_of_element_located((By.XPATH, "//input[contains(@placeholder,'location') or contains(@placeholder,'address')]"))
+                    )
+                    loc.clear()
+                    loc.send_keys("Connaught Place, New Delhi, Delhi 110001")
                     try:
-                        img = c.find_element(By.XPATH, ".//img[@alt]")
-                        name = img.get_attribute("alt") or ""
+                        WebDriverWait(driver,7).until(
+                            EC.element_to_be_clickable((By.XPATH, "//div[contains(@class,'suggestion')]//div[1]"))
+                        ).click()
                     except:
-                        pass
-                    if not name:
-                        name = clean_name_lines(txt)
-                    prod = normalize_record("Zepto", name, txt, href)
-                    if not prod:
-                        continue
-                    key = (prod.product_name.lower(), prod.brand.lower(), int(prod.weight_grams) if prod.weight_grams else 0)
-                    if key in seen_keys:
-                        continue
-                    seen_keys.add(key)
-                    out.append(prod)
-                    if len(out) >= 80:
-                        break
+                        from selenium.webdriver.common.keys import Keys
+                        loc.send_keys(Keys.RETURN)
+                    # the location is applied once the suggestion list closes
+                    WebDriverWait(driver, 5).until(
+                        EC.invisibility_of_element_located((By.XPATH, "//div[contains(@class,'suggestion')]"))
+                    )
                 except:
-                    continue
-            return out
+                    pass
+
+                driver.get(url)
+                try:
+                    self.wait_for(driver, (By.XPATH, " | ".join(ZEPTO_CARD_XPATHS)))
+                except TimeoutException:
+                    pass
+                self.scroll(driver, 6, 1.0)
+
+                containers = driver.execute_script(ZEPTO_CARDS_JS, ZEPTO_CARD_XPATHS)
+                if self.cache_ttl:
+                    save_cached_tiles(url, containers)
+            return containers
         finally:
-            if driver:
+            if own_driver and driver:
                 driver.quit()
 
-    def scrape_jiomart(self, url="https://www.jiomart.com/search/bread") -> List[Product]:
-        out: List[Product] = []
-        driver = None
+    def scrape_jiomart(self, url=JIOMART_URL, driver=None) -> List[Product]:
+        return parse_jiomart_tiles(self.fetch_jiomart(url, driver))
+
+    def fetch_jiomart(self, url=JIOMART_URL, driver=None) -> list:
+        own_driver = driver is None
         try:
-            driver = setup_driver(self.headless)
-            driver.get(url)
-            time.sleep(2)
-            self.wait_dom(driver, 20)
-            self.scroll(driver, 4, 0.8)
-            WebDriverWait(driver, 15).until(
-                EC.presence_of_all_elements_located((By.CSS_SELECTOR, "[id*='product'], .product-tile, .ais-InfiniteHits-item"))
-            )
-            tiles = driver.find_elements(By.CSS_SELECTOR, "[id*='product'], .product-tile, .ais-InfiniteHits-item")
-            seen = set()
-            for t in tiles[:120]:
-                try:
-                    block = (t.text or "").strip()
-                    if not block:
-                        continue
-                    # name
-                    try:
-                        name = t.find_element(By.CSS_SELECTOR, ".product-name, .jm-body-xs, [class*='title']").text.strip()
-                    except:
-                        name = clean_name_lines(block)
-                    if not name:
-                        continue
-                    # filter accessories
-                    if not is_bread_like(name):
-                        continue
-                    # url
-                    try:
-                        href = t.find_element(By.CSS_SELECTOR, "a").get_attribute("href")
-                    except:
-                        href = None
-                    prod = normalize_record("JioMart", name, block, href)
-                    if not prod:
-                        continue
-                    key = (prod.product_name.lower(), prod.brand.lower(), int(prod.weight_grams) if prod.weight_grams else 0)
-                    if key in seen:
-                        continue
-                    seen.add(key)
-                    out.append(prod)
-                    if len(out) >= 80:
-                        break
-                except:
-                    continue
-            return out
+            tiles = load_cached_tiles(url, self.cache_ttl)
+            if tiles is None:
+                if own_driver:
+                    driver = setup_driver(self.headless)
+                driver.get(url)
+                self.wait_for(driver, (By.CSS_SELECTOR, JIOMART_TILE_SELECTOR))
+                self.scroll(driver, 4, 0.8)
+                tiles = driver.execute_script(JIOMART_TILES_JS, JIOMART_TILE_SELECTOR)
+                if self.cache_ttl:
+                    save_cached_tiles(url, tiles)
+            return tiles
         finally:
-            if driver:
+            if own_driver and driver:
                 driver.quit()
 
-    def scrape_amazon_fresh(self, url="https://www.amazon.in/s?k=bread&i=fresh&rh=n%3A21862203031") -> List[Product]:
-        out: List[Product] = []
-        driver = None
+    def scrape_amazon_fresh(self, url=AMAZON_FRESH_URL, driver=None) -> List[Product]:
+        return parse_amazon_fresh_tiles(self.fetch_amazon_fresh(url, driver))
+
+    def fetch_amazon_fresh(self, url=AMAZON_FRESH_URL, driver=None) -> list:
+        own_driver = driver is None
         try:
-            driver = setup_driver(self.headless)
-            driver.get(url)
-            time.sleep(2)
-            self.wait_dom(driver, 20)
-            self.scroll(driver, 4, 0.8)
-            WebDriverWait(driver, 15).until(
-                EC.presence_of_all_elements_located((By.CSS_SELECTOR, "[data-component-type='s-search-result']"))
-            )
-            tiles = driver.find_elements(By.CSS_SELECTOR, "[data-component-type='s-search-result']")
-            seen = set()
-            for t in tiles[:120]:
-                try:
-                    try:
-                        name = t.find_element(By.CSS_SELECTOR, "h2 a span, .a-text-normal").text.strip()
-                    except:
-                        name = (t.text or "").strip()
-                    if not name or not is_bread_like(name):
-                        continue
-                    # block & price
-                    block = (t.text or "").strip()
-                    # prefer offscreen price
-                    price_txt = ""
-                    off = t.find_elements(By.CSS_SELECTOR, ".a-price .a-offscreen")
-                    if off:
-                        price_txt = off[0].get_attribute("innerText")
-                    else:
-                        whole = t.find_elements(By.CSS_SELECTOR, ".a-price-whole")
-                        frac = t.find_elements(By.CSS_SELECTOR, ".a-price-fraction")
-                        if whole:
-                            price_txt = f"₹{whole[0].text}.{frac[0].text if frac else '00'}"
-                    try:
-                        href = t.find_element(By.CSS_SELECTOR, "h2 a").get_attribute("href")
-                    except:
-                        href = None
-                    prod = normalize_record("Amazon Fresh", name, f"{block}\n{price_txt}", href)
-                    if not prod:
-                        continue
-                    key = (prod.product_name.lower(), prod.brand.lower(), int(prod.weight_grams) if prod.weight_grams else 0)
-                    if key in seen:
-                        continue
-                    seen.add(key)
-                    out.append(prod)
-                    if len(out) >= 80:
-                        break
-                except:
-                    continue
-            return out
+            tiles = load_cached_tiles(url, self.cache_ttl)
+            if tiles is None:
+                if own_driver:
+                    driver = setup_driver(self.headless)
+                driver.get(url)
+                self.wait_for(driver, (By.CSS_SELECTOR, AMAZON_TILE_SELECTOR))
+                self.scroll(driver, 4, 0.8)
+                tiles = driver.execute_script(AMAZON_TILES_JS, AMAZON_TILE_SELECTOR)
+                if self.cache_ttl:
+                    save_cached_tiles(url, tiles)
+            return tiles
         finally:
-            if driver:
+            if own_driver and driver:
                 driver.quit()
 
-    def scrape_all(self) -> List[Product]:
+    def scrape_all(self, parallel=True) -> List[Product]:
+        """Scrape every platform and store the products in self.results.
+
+        parallel=True runs each platform in its own worker process with its
+        own short-lived browser. The persistent session from _get_driver()
+        is only used with parallel=False, where one browser serves all
+        platforms and is kept across calls until close().
+        """
+        scrapers = (self.scrape_zepto, self.scrape_jiomart, self.scrape_amazon_fresh)
         results = []
-        results.extend(self.scrape_zepto())
-        results.extend(self.scrape_jiomart())
-        results.extend(self.scrape_amazon_fresh())
+        if parallel:
+            # One worker process (and browser) per platform overlaps the page loads
+            # and keeps WebDriver state out of shared threads; results keep the
+            # platform order
+            with ProcessPoolExecutor(max_workers=len(scrapers)) as pool:
+                futures = [pool.submit(scrape_platform, scrape.__name__, self.headless, self.cache_ttl) for scrape in scrapers]
+                for future in futures:
+                    results.extend(future.result())
+            self.results = results
+            return results
+
+        # One browser for all platforms, reused across calls until close();
+        # Chrome startup costs seconds per launch
+        driver = self._get_driver()
+        steps = (
+            (self.fetch_zepto, parse_zepto_tiles),
+            (self.fetch_jiomart, parse_jiomart_tiles),
+            (self.fetch_amazon_fresh, parse_amazon_fresh_tiles),
+        )
+        # a site's tiles are normalized on a worker thread while the browser
+        # loads the next site; WebDriver calls block on sockets and release the GIL
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            parsed = []
+            for fetch, parse in steps:
+                # keep each site's session state away from the next one
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+                parsed.append(pool.submit(parse, fetch(driver=driver)))
+            for future in parsed:
+                results.extend(future.result())
         self.results = results
         return results
 
     def to_dataframe(self) -> pd.DataFrame:
-        df = pd.DataFrame([asdict(p) for p in self.results])
-        # order columns
-        cols = ["platform","product_name","brand","pack_display","price_rupees","qty","unit","weight_grams","url"]
-        return df[cols]
+        return pd.DataFrame.from_records([p.to_tuple() for p in self.results], columns=PRODUCT_COLUMNS)
 
     def save_csv(self, filename="bread_products.csv"):
         if not self.results:
             print("No data to save.")
             return
         os.makedirs("data", exist_ok=True)
-        import pandas as pd
-        df = pd.DataFrame(self.results)
-        cols = ["platform","product_name","brand","pack_display","price_rupees","qty","unit","weight_grams","url"]
-        for c in cols:
-            if c not in df.columns:
-                df[c] = None
-        df = df[cols]
-        df.to_csv(f"data/{filename}", index=False)
+        # rows go straight from the dataclasses to disk, no DataFrame in between
+        with open(f"data/{filename}", "w", encoding="utf-8") as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(PRODUCT_COLUMNS)
+            writer.writerows(p.to_tuple() for p in self.results)
 
 
     def summarize(self):
@@ -437,9 +658,20 @@ class BreadScraper:
         print("\nSample:")
         print(df.head(15).to_string(index=False))
 
+def scrape_platform(method_name: str, headless: bool = True, cache_ttl: float = 0) -> List[Product]:
+    # Module-level so ProcessPoolExecutor can pickle it
+    return getattr(BreadScraper(headless, cache_ttl), method_name)()
+
 
 if __name__ == "__main__":
-    scraper = BreadScraper(headless=True)
-    scraper.scrape_all()
+    parser = argparse.ArgumentParser(description="Scrape bread products from Zepto, JioMart and Amazon Fresh")
+    parser.add_argument("--cache", action="store_true",
+                        help=f"reuse page payloads fetched within the last {CACHE_TTL // 60} minutes")
+    args = parser.parse_args()
+    scraper = BreadScraper(headless=True, cache_ttl=CACHE_TTL if args.cache else 0)
+    try:
+        scraper.scrape_all()
+    finally:
+        scraper.close()
     scraper.summarize()
     scraper.save_csv()
@@ -1,7 +1,10 @@
+import os
+import re
 import streamlit as st
 import pandas as pd 
-import plotly.express as px
+import numpy as np
 import plotly.graph_objects as go
+from plotly.colors import qualitative
 from plotly.subplots import make_subplots
 
 st.set_page_config(
@@ -32,26 +35,116 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
+PRODUCT_DTYPES = {
+    'platform': 'category',
+    'brand': 'category',
+    'brand_clean': 'category',
+    'price_rupees': 'float32',
+    'price_per_100g': 'float32',
+    'weight_grams': 'float32',
+}
+
+COMPARISON_DTYPES = {
+    'platform_1': 'category',
+    'platform_2': 'category',
+    'cheaper_platform': 'category',
+    'brand': 'category',
+    'weight_grams': 'float32',
+    'price_1': 'float32',
+    'price_2': 'float32',
+    'price_diff': 'float32',
+    'best_price': 'float32',
+    'savings': 'float32',
+}
+
+SCATTER_MAX_POINTS = 5000
+
+PRICE_BUCKETS = 20
+
+def read_table(name, dtypes=None):
+    parquet_path = f'data/{name}.parquet'
+    if os.path.exists(parquet_path):
+        df = pd.read_parquet(parquet_path, engine='pyarrow', memory_map=True)
+        if dtypes:
+            df = df.astype({col: dtype for col, dtype in dtypes.items() if col in df.columns})
+        return df
+    return pd.read_csv(f'data/{name}.csv', engine='pyarrow', dtype=dtypes)
+
+def share_categories(columns):
+    categories = set()
+    for col in columns:
+        categories.update(col.cat.categories)
+    dtype = pd.CategoricalDtype(categories=sorted(categories))
+    return [col.astype(dtype) for col in columns]
+
 @st.cache_data
 def load_data():
     try:
-        processed_data = pd.read_csv('data/processed_products.csv')
-        matched_products = pd.read_csv('data/processed_matched.csv')
-        price_comparison = pd.read_csv('data/processed_price_comparison.csv')
-        platform_summary = pd.read_csv('data/processed_platform_summary.csv')
-        brand_summary = pd.read_csv('data/processed_brand_summary.csv')
+        processed_data = read_table('processed_products', PRODUCT_DTYPES)
+        matched_products = read_table('processed_matched')
+        price_comparison = read_table('processed_price_comparison', COMPARISON_DTYPES)
+        platform_summary = read_table('processed_platform_summary')
+        brand_summary = read_table('processed_brand_summary')
+
+        # Align category codes across frames so filters and comparisons share them
+        (processed_data['platform'], price_comparison['platform_1'],
+         price_comparison['platform_2'], price_comparison['cheaper_platform']) = share_categories([
+            processed_data['platform'], price_comparison['platform_1'],
+            price_comparison['platform_2'], price_comparison['cheaper_platform']
+        ])
+        processed_data['brand_clean'], price_comparison['brand'] = share_categories([
+            processed_data['brand_clean'], price_comparison['brand']
+        ])
+
+        # Lowercased name + brand, searched with a plain substring test in the Product Search tab
+        search_blob = (processed_data['product_name'].fillna('') + ' '
+                       + processed_data['brand_clean'].astype('string').fillna(''))
+        processed_data['_search_blob'] = search_blob.str.lower().astype('string[pyarrow]')
+
+        # Sum/count cube of unit prices per (platform, brand, price bucket), plus
+        # the rows sorted by bucket with per-bucket offsets so a query only
+        # slices out the buckets cut by the slider bounds
+        price_min = float(processed_data['price_rupees'].min())
+        price_max = float(processed_data['price_rupees'].max())
+        price_bucket_edges = np.linspace(price_min, price_max, PRICE_BUCKETS + 1)
+        buckets = np.searchsorted(price_bucket_edges, processed_data['price_rupees'].to_numpy(), side='left') - 1
+        buckets = np.clip(buckets, 0, PRICE_BUCKETS - 1)
+        order = np.argsort(buckets, kind='stable')
+        bucket_rows = processed_data[['platform', 'brand_clean', 'price_rupees', 'price_per_100g']].iloc[order].reset_index(drop=True)
+        bucket_rows['_price_bucket'] = buckets[order]
+        bucket_offsets = np.searchsorted(buckets[order], np.arange(PRICE_BUCKETS + 1), side='left')
+        unit_price_cube = bucket_rows.groupby(
+            ['platform', 'brand_clean', '_price_bucket'], observed=True
+        )['price_per_100g'].agg(['sum', 'count', 'size']).reset_index()
         
         return {
             'processed': processed_data,
             'matched': matched_products,
             'comparison': price_comparison,
             'platform_summary': platform_summary,
-            'brand_summary': brand_summary
+            'brand_summary': brand_summary,
+            'platforms': sorted(processed_data['platform'].unique().tolist()),
+            'brands': sorted(processed_data['brand_clean'].dropna().unique().tolist()),
+            'price_min': price_min,
+            'price_max': price_max,
+            'price_bucket_edges': price_bucket_edges,
+            'bucket_rows': bucket_rows,
+            'bucket_offsets': bucket_offsets,
+            'unit_price_cube': unit_price_cube
         }
     except Exception as e:
         st.error(f"Error loading data: {e}")
         return None
     
+def rupee_column(label):
+    return st.column_config.NumberColumn(label, format="₹%.2f")
+
+def weight_column(label):
+    return st.column_config.NumberColumn(label, format="%.0fg")
+
+def count_column(label):
+    return st.column_config.NumberColumn(label, format="%d")
+
 def create_price_distribution(data, platform_filter=None):
     if platform_filter and len(platform_filter) > 0:
         data = data[data['platform'].isin(platform_filter)]
@@ -59,17 +152,19 @@ def create_price_distribution(data, platform_filter=None):
     if len(data) == 0:
         return go.Figure().add_annotation(text="No data available for the selected filters", xref="paper", yref="paper", showarrow=False, font=dict(size=20))
     
-    fig = px.bar(
-        data, 
-        x='platform', 
-        y='price_rupees', 
-        color='platform',
-        title="Price Distribution by Platform",
-        labels={"platform": "Platform", "price_rupees": "Price (₹)"},
-        color_discrete_sequence=px.colors.qualitative.Set2
-    )
+    fig = go.Figure()
+    for i, (platform, prices) in enumerate(data.groupby('platform', observed=True)['price_rupees']):
+        fig.add_trace(go.Bar(
+            x=np.full(len(prices), platform, dtype=object),
+            y=prices.to_numpy(),
+            name=str(platform),
+            marker_color=qualitative.Set2[i % len(qualitative.Set2)],
+            hovertemplate="Platform=%{x}<br>Price (₹)=%{y}<extra></extra>"
+        ))
 
     fig.update_layout(
+        title="Price Distribution by Platform",
+        barmode='relative',
         showlegend=False,
         height=400,
         xaxis_title='Platform',
@@ -78,32 +173,58 @@ def create_price_distribution(data, platform_filter=None):
 
     return fig 
 
-def create_unit_price_comparison(data, platform_filter=None):
-    if platform_filter and len(platform_filter) > 0:
-        data = data[data['platform'].isin(platform_filter)]
-    
-    if len(data) == 0:
+def unit_price_totals(data, platforms_key, brands_key, price_range):
+    # Price buckets that lie entirely inside the slider range are read from
+    # the pre-aggregated cube; only the rows of the buckets cut by the range
+    # bounds are scanned, so the cost does not grow with the product count.
+    lo, hi = price_range
+    edges = data['price_bucket_edges']
+    inside = (edges[:-1] >= lo) & (edges[1:] <= hi)
+    cut = np.flatnonzero(~inside & (edges[1:] >= lo) & (edges[:-1] <= hi))
+
+    cube = data['unit_price_cube']
+    cube_mask = inside[cube['_price_bucket'].to_numpy()]
+
+    offsets = data['bucket_offsets']
+    cut_rows = [np.arange(offsets[b], offsets[b + 1]) for b in cut]
+    rows = data['bucket_rows'].iloc[np.concatenate(cut_rows) if cut_rows else []]
+    prices = rows['price_rupees'].to_numpy()
+    row_mask = (prices >= lo) & (prices <= hi)
+
+    if platforms_key:
+        cube_mask &= cube['platform'].isin(platforms_key).to_numpy()
+        row_mask &= rows['platform'].isin(platforms_key).to_numpy()
+    if brands_key:
+        cube_mask &= cube['brand_clean'].isin(brands_key).to_numpy()
+        row_mask &= rows['brand_clean'].isin(brands_key).to_numpy()
+
+    boundary = rows[row_mask].groupby('platform', observed=True)['price_per_100g'].agg(['sum', 'count', 'size']).reset_index()
+    partials = pd.concat([cube.loc[cube_mask, ['platform', 'sum', 'count', 'size']], boundary])
+
+    return partials.groupby('platform', observed=True)[['sum', 'count', 'size']].sum()
+
+def create_unit_price_comparison(totals):
+    if totals['size'].sum() == 0:
         return go.Figure().add_annotation(text="No data available for the selected filters", xref="paper", yref="paper", showarrow=False, font=dict(size=20))
     
-    data_clean = data[data['price_per_100g'].notna()].copy()
+    totals = totals[totals['count'] > 0]
 
-    if len(data_clean) == 0:
+    if len(totals) == 0:
         return go.Figure().add_annotation(text="No unit price data available for the selected filters", xref="paper", yref="paper", showarrow=False, font=dict(size=20))
     
-    avg_unit_prices = data_clean.groupby('platform')['price_per_100g'].mean().reset_index()
+    avg_unit_prices = (totals['sum'] / totals['count']).rename('price_per_100g').reset_index()
     avg_unit_prices = avg_unit_prices.sort_values('price_per_100g')
 
-    fig = px.box(
-        avg_unit_prices, 
-        x='platform', 
-        y='price_per_100g', 
-        color='platform',
-        title="Average Price per 100g by Platform",
-        labels={'price_per_100g': 'Price per 100g (₹)', 'platform': 'Platform'},
-        color_discrete_sequence=px.colors.qualitative.Pastel
-    )
+    colors = [qualitative.Pastel[i % len(qualitative.Pastel)] for i in range(len(avg_unit_prices))]
+    fig = go.Figure(go.Bar(
+        x=avg_unit_prices['platform'].astype(str).to_numpy(),
+        y=avg_unit_prices['price_per_100g'].to_numpy(),
+        marker_color=colors,
+        hovertemplate="Platform=%{x}<br>Price per 100g (₹)=%{y:.2f}<extra></extra>"
+    ))
 
     fig.update_layout(
+        title="Average Price per 100g by Platform",
         showlegend=False,
         height=400,
         xaxis_title='Platform',
@@ -115,12 +236,26 @@ def create_unit_price_comparison(data, platform_filter=None):
 def create_brand_analysis(df):
     if len(df) == 0:
         return go.Figure().add_annotation(text="No data available", showarrow=False)
-    brand_data = df.groupby('brand_clean').agg({
-        'product_name': 'count',
-        'price_rupees': 'mean'
-    }).reset_index()
-    brand_data.columns = ["Brand", "Product Count", "Avg Price"]
-    brand_data = brand_data.sort_values('Product Count', ascending=False).head(10)
+    brands = df['brand_clean'].cat.categories
+    codes = df['brand_clean'].cat.codes.to_numpy()
+    names = df['product_name'].notna().to_numpy()
+    prices = df['price_rupees'].to_numpy(dtype=np.float64)
+    priced = (codes >= 0) & ~np.isnan(prices)
+    valid = codes >= 0
+
+    counts = np.bincount(codes[valid & names], minlength=len(brands))
+    price_counts = np.bincount(codes[priced], minlength=len(brands))
+    price_sums = np.bincount(codes[priced], weights=prices[priced], minlength=len(brands))
+    present = np.bincount(codes[valid], minlength=len(brands)) > 0
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = price_sums / price_counts
+
+    brand_data = pd.DataFrame({
+        "Brand": brands[present],
+        "Product Count": counts[present],
+        "Avg Price": means[present]
+    })
+    brand_data = brand_data.sort_values('Product Count', ascending=False, kind='stable').head(10)
     if len(brand_data) == 0:
         return go.Figure().add_annotation(text="No brand data available", showarrow=False)
     
@@ -147,54 +282,64 @@ def create_platform_comparison_matrix(df):
     if len(df) == 0:
         return go.Figure().add_annotation(text="No comparison data available", showarrow=False)
     
-    platforms = list(set(df['platform_1'].unique().tolist() + df['platform_2'].unique().tolist()))
-    platforms = sorted(platforms)
-
-    matrix = pd.DataFrame(0.0, index=platforms, columns=platforms)
-
-    for _, row in df.iterrows():
-        p1, p2 = row['platform_1'], row['platform_2']
-        if pd.notna(row['price_1']) and pd.notna(row['price_2']):
-            if row['price_1'] < row['price_2']:
-                matrix.loc[p1, p2] += 1
-            else:
-                matrix.loc[p2, p1] += 1
-
-    fig = px.imshow(
-        matrix,
-        labels=dict(x="Platform", y="Platform", color="Times Cheaper"),
-        x=matrix.columns,
-        y=matrix.index,
+    # platform_1/platform_2 share one sorted CategoricalDtype (see load_data), so a
+    # (winner, loser) pair maps to the flat cell winner * p + loser
+    categories = df['platform_1'].cat.categories
+    p = len(categories)
+    codes_1 = df['platform_1'].cat.codes.to_numpy().astype(np.intp)
+    codes_2 = df['platform_2'].cat.codes.to_numpy().astype(np.intp)
+    seen = np.concatenate([codes_1, codes_2])
+    platforms = categories[np.bincount(seen[seen >= 0], minlength=p) > 0]
+    price_1 = df['price_1'].to_numpy()
+    price_2 = df['price_2'].to_numpy()
+
+    valid = ~np.isnan(price_1) & ~np.isnan(price_2) & (codes_1 >= 0) & (codes_2 >= 0)
+    cheaper_is_1 = price_1[valid] < price_2[valid]
+    winner = np.where(cheaper_is_1, codes_1[valid], codes_2[valid])
+    loser = np.where(cheaper_is_1, codes_2[valid], codes_1[valid])
+
+    counts = np.bincount(winner * p + loser, minlength=p * p).reshape(p, p)
+    matrix = pd.DataFrame(counts, index=categories, columns=categories).loc[platforms, platforms]
+
+    fig = go.Figure(go.Heatmap(
+        z=matrix.values,
+        x=matrix.columns.astype(str),
+        y=matrix.index.astype(str),
+        text=matrix.values,
+        texttemplate='%{text}',
+        colorscale='RdYlGn',
+        colorbar=dict(title="Times Cheaper"),
+        hovertemplate="Cheaper: %{y}<br>Than: %{x}<br>Times Cheaper=%{z}<extra></extra>"
+    ))
+
+    fig.update_layout(
         title="Platform Price Comparison Matrix",
-        color_continuous_scale='RdYlGn',
-        text_auto=True
+        height=400,
+        xaxis_title="Platform",
+        yaxis_title="Platform",
+        yaxis_autorange='reversed'
     )
 
-    fig.update_layout(height=400)
-
     return fig 
 
-def create_savings_chart(df):
-    if len(df) == 0:
+def create_savings_chart(top_savings):
+    if len(top_savings) == 0:
         return go.Figure().add_annotation(text="No savings data available", showarrow=False)
-    top_savings = df.nlargest(min(15, len(df)), 'savings')
     top_savings = top_savings.copy()
-    top_savings['product_name_short'] = top_savings['product_name'].apply(
-        lambda x: x[:50] + '...' if len(str(x)) > 50 else x
-    )
+    names = top_savings['product_name'].astype(str)
+    top_savings['product_name_short'] = names.where(names.str.len() <= 50, names.str.slice(0, 50) + '...')
 
-    fig = px.bar(
-        top_savings,
-        x='savings',
-        y='product_name_short',
+    savings = top_savings['savings'].to_numpy()
+    fig = go.Figure(go.Bar(
+        x=savings,
+        y=top_savings['product_name_short'].to_numpy(),
         orientation='h',
-        color='savings',
-        title='Top Products with Highest Savings Potential',
-        labels={'savings': 'Savings (₹)', 'product_name_short': 'Product'},
-        color_continuous_scale='Reds'
-    )
+        marker=dict(color=savings, colorscale='Reds', colorbar=dict(title="Savings (₹)")),
+        hovertemplate="Savings (₹)=%{x}<br>Product=%{y}<extra></extra>"
+    ))
     
     fig.update_layout(
+        title='Top Products with Highest Savings Potential',
         height=500,
         yaxis={'categoryorder': 'total ascending'},
         xaxis_title='Potential Savings (₹)',
@@ -202,7 +347,338 @@ def create_savings_chart(df):
     )
     
     return fig   
+
+def create_best_price_pie(df):
+    platforms = df['cheaper_platform'].cat.categories
+    codes = df['cheaper_platform'].cat.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(platforms))
+    platform_wins = pd.DataFrame({'Platform': platforms, 'Times Cheapest': counts})
+    platform_wins = platform_wins[platform_wins['Times Cheapest'] > 0]
+
+    fig = go.Figure(go.Pie(
+        labels=platform_wins['Platform'].astype(str).to_numpy(),
+        values=platform_wins['Times Cheapest'].to_numpy()
+    ))
+    fig.update_layout(title="Which Platform Offers Best Price Most Often?")
+
+    return fig
+
+def create_price_weight_scatter(df, brand_filter=None):
+    if brand_filter and len(brand_filter) > 0:
+        df = df[df['brand_clean'].isin(brand_filter)]
+
+    scatter_data = df[
+        df['weight_grams'].notna() &
+        df['price_per_100g'].notna()
+    ].copy()
+
+    if len(scatter_data) == 0:
+        return None
+
+    if len(scatter_data) > SCATTER_MAX_POINTS:
+        # Stratified sample: an equal share of points per platform
+        per_platform = SCATTER_MAX_POINTS // scatter_data['platform'].nunique()
+        scatter_data = scatter_data.sample(frac=1, random_state=0).groupby('platform', observed=True).head(per_platform)
+
+    # Marker area scales with price per 100g, largest marker 20px wide
+    sizeref = 2.0 * scatter_data['price_per_100g'].max() / (20 ** 2)
+    fig = go.Figure()
+    for i, (platform, group) in enumerate(scatter_data.groupby('platform', observed=True)):
+        fig.add_trace(go.Scattergl(
+            x=group['weight_grams'].to_numpy(),
+            y=group['price_rupees'].to_numpy(),
+            mode='markers',
+            name=str(platform),
+            marker=dict(
+                size=group['price_per_100g'].to_numpy(),
+                sizemode='area',
+                sizeref=sizeref,
+                color=qualitative.Plotly[i % len(qualitative.Plotly)]
+            ),
+            customdata=np.column_stack([
+                group['product_name'].to_numpy(),
+                group['brand_clean'].astype(str).to_numpy()
+            ]),
+            hovertemplate=("Weight (g)=%{x}<br>Price (₹)=%{y}<br>"
+                           "%{customdata[0]}<br>%{customdata[1]}<extra></extra>")
+        ))
+    fig.update_layout(
+        title="Price vs Weight Analysis",
+        height=500,
+        xaxis_title='Weight (g)',
+        yaxis_title='Price (₹)',
+        legend_title_text='platform'
+    )
+
+    return fig
+
+def platform_price_stats(df):
+    # One pass of bincount reductions over the platform codes instead of a
+    # groupby; medians come from per-platform slices of a single argsort.
+    platforms = df['platform'].cat.categories
+    codes = df['platform'].cat.codes.to_numpy()
+    prices = df['price_rupees'].to_numpy(dtype=np.float64)
+    keep = (codes >= 0) & ~np.isnan(prices)
+    codes, prices = codes[keep], prices[keep]
+
+    n_groups = len(platforms)
+    counts = np.bincount(codes, minlength=n_groups)
+    present = counts > 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        means = np.bincount(codes, weights=prices, minlength=n_groups) / counts
+        sq_dev = np.bincount(codes, weights=(prices - means[codes]) ** 2, minlength=n_groups)
+        stds = np.sqrt(sq_dev / (counts - 1))
+
+    sorted_prices = prices[np.argsort(codes, kind='stable')]
+    ends = np.cumsum(counts)
+    medians = np.full(n_groups, np.nan)
+    for g in np.flatnonzero(present):
+        medians[g] = np.median(sorted_prices[ends[g] - counts[g]:ends[g]])
+
+    return pd.DataFrame({
+        'Platform': platforms[present],
+        'Mean Price': means[present],
+        'Median Price': medians[present],
+        'Std Dev': stds[present]
+    })
+
+def top_k_indices(values, k):
+    # Partial selection of the k largest values, largest first. Ties at the cut-off
+    # keep the earliest rows and NaNs only pad a short result, as DataFrame.nlargest does
+    missing = np.isnan(values)
+    candidates = np.flatnonzero(~missing)
+    if len(candidates) > k:
+        vals = values[candidates]
+        threshold = np.partition(vals, len(vals) - k)[len(vals) - k]
+        above = vals > threshold
+        at = vals == threshold
+        candidates = candidates[above | (at & (np.cumsum(at) <= k - above.sum()))]
+    top = candidates[np.argsort(-values[candidates], kind='stable')]
+    return np.concatenate([top, np.flatnonzero(missing)[:k - len(top)]])
+
+@st.cache_data
+def filter_data(platforms_key, brands_key, price_range):
+    data = load_data()
+
+    products = data['processed']
+    prices = products['price_rupees'].to_numpy()
+    mask = (prices >= price_range[0]) & (prices <= price_range[1])
+    if platforms_key:
+        mask &= products['platform'].isin(platforms_key).to_numpy()
+    if brands_key:
+        mask &= products['brand_clean'].isin(brands_key).to_numpy()
+    filtered_data = products[mask]
+
+    comparison = data['comparison']
+    if platforms_key:
+        comparison_mask = (comparison['platform_1'].isin(platforms_key).to_numpy()
+                           & comparison['platform_2'].isin(platforms_key).to_numpy())
+        filtered_comparison = comparison[comparison_mask]
+    else:
+        filtered_comparison = comparison
+
+    return filtered_data, filtered_comparison
+
+# Figures are cached on the hashable filter state rather than on the filtered
+# frames, so Streamlit never has to hash a DataFrame to find a cache hit.
+@st.cache_data
+def price_distribution_fig(platforms_key, brands_key, price_range):
+    filtered_data, _ = filter_data(platforms_key, brands_key, price_range)
+    return create_price_distribution(filtered_data, list(platforms_key))
+
+@st.cache_data
+def unit_price_comparison_fig(platforms_key, brands_key, price_range):
+    totals = unit_price_totals(load_data(), platforms_key, brands_key, price_range)
+    return create_unit_price_comparison(totals)
+
+@st.cache_data
+def brand_analysis_fig(platforms_key, brands_key, price_range):
+    filtered_data, _ = filter_data(platforms_key, brands_key, price_range)
+    return create_brand_analysis(filtered_data)
+
+@st.cache_data
+def platform_comparison_matrix_fig(platforms_key, brands_key, price_range):
+    _, filtered_comparison = filter_data(platforms_key, brands_key, price_range)
+    return create_platform_comparison_matrix(filtered_comparison)
+
+@st.cache_data
+def savings_chart_fig(platforms_key, brands_key, price_range):
+    return create_savings_chart(top_savings(platforms_key, brands_key, price_range))
+
+@st.cache_data
+def price_weight_scatter_fig(platforms_key, brands_key, price_range):
+    filtered_data, _ = filter_data(platforms_key, brands_key, price_range)
+    return create_price_weight_scatter(filtered_data, list(brands_key))
+
+@st.cache_data
+def best_price_pie_fig(platforms_key, brands_key, price_range):
+    _, filtered_comparison = filter_data(platforms_key, brands_key, price_range)
+    return create_best_price_pie(filtered_comparison)
+
+@st.cache_data
+def platform_stats_table(platforms_key, brands_key, price_range):
+    filtered_data, _ = filter_data(platforms_key, brands_key, price_range)
+    return platform_price_stats(filtered_data)
+
+@st.cache_data
+def top_savings(platforms_key, brands_key, price_range, k=15):
+    _, filtered_comparison = filter_data(platforms_key, brands_key, price_range)
+    return filtered_comparison.iloc[top_k_indices(filtered_comparison['savings'].to_numpy(dtype=np.float64), k)]
+
+@st.cache_data
+def top_deals_table(platforms_key, brands_key, price_range):
+    return top_savings(platforms_key, brands_key, price_range).head(10)[
+        ['product_name', 'brand', 'weight_grams', 'platform_1', 'price_1', 'platform_2', 'price_2', 'cheaper_platform', 'best_price', 'savings']
+    ]
+
+TOP_DEALS_COLUMNS = {
+    'product_name': 'Product',
+    'brand': 'Brand',
+    'weight_grams': weight_column('Weight'),
+    'platform_1': 'Platform 1',
+    'price_1': rupee_column('Price 1'),
+    'platform_2': 'Platform 2',
+    'price_2': rupee_column('Price 2'),
+    'cheaper_platform': 'Cheaper On',
+    'best_price': rupee_column('Best Price'),
+    'savings': rupee_column('Save'),
+}
+
+SEARCH_RESULT_COLUMNS = {
+    'platform': 'Platform',
+    'product_name': 'Product',
+    'brand_clean': 'Brand',
+    'weight_grams': weight_column('Weight'),
+    'price_rupees': rupee_column('Price'),
+    'price_per_100g': rupee_column('Price/100g'),
+}
+
+PLATFORM_STATS_COLUMNS = {
+    'Mean Price': rupee_column('Mean Price'),
+    'Median Price': rupee_column('Median Price'),
+    'Std Dev': rupee_column('Std Dev'),
+}
+
+PLATFORM_SUMMARY_COLUMNS = {
+    'total_products': count_column('total_products'),
+    'avg_price': rupee_column('avg_price'),
+    'median_price': rupee_column('median_price'),
+    'min_price': rupee_column('min_price'),
+    'max_price': rupee_column('max_price'),
+    'avg_price_per_100g': rupee_column('avg_price_per_100g'),
+    'median_price_per_100g': rupee_column('median_price_per_100g'),
+}
+
+BRAND_SUMMARY_COLUMNS = {
+    'product_count': count_column('product_count'),
+    'platforms_available': count_column('platforms_available'),
+    'avg_price': rupee_column('avg_price'),
+    'avg_price_per_100g': rupee_column('avg_price_per_100g'),
+}
     
+def render_overview(filter_key, filtered_comparison):
+    st.header("Market Overview")
+    col1, col2 = st.columns(2)
+    with col1:
+        st.plotly_chart(price_distribution_fig(*filter_key), use_container_width=True)
+    with col2:
+        st.plotly_chart(unit_price_comparison_fig(*filter_key), use_container_width=True)
+    st.plotly_chart(brand_analysis_fig(*filter_key), use_container_width=True)
+    if len(filtered_comparison) > 0:
+        st.plotly_chart(platform_comparison_matrix_fig(*filter_key), use_container_width=True)
+
+def render_best_deals(filter_key, filtered_comparison):
+    st.header("Best Deals and Savings")
+    if len(filtered_comparison) > 0:
+        st.plotly_chart(savings_chart_fig(*filter_key), use_container_width=True)
+        st.subheader("Top 10 Deals")
+        st.dataframe(
+            top_deals_table(*filter_key),
+            column_config=TOP_DEALS_COLUMNS,
+            use_container_width=True,
+            hide_index=True
+        )
+    else:
+        st.info("No matched products found with current filters")
+
+def render_price_analysis(filter_key, filtered_data, filtered_comparison):
+    st.header("Detailed Price Analysis")
+    fig = price_weight_scatter_fig(*filter_key)
+    if fig is not None:
+        st.plotly_chart(fig, use_container_width=True)
+    else:
+        st.info("No data available for scatter plot with current filters")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        if len(filtered_data) > 0:
+            st.subheader("Platform Statistics")
+            st.dataframe(
+                platform_stats_table(*filter_key),
+                column_config=PLATFORM_STATS_COLUMNS,
+                use_container_width=True,
+                hide_index=True
+            )
+    with col2:
+        if len(filtered_comparison) > 0:
+            st.plotly_chart(best_price_pie_fig(*filter_key), use_container_width=True)
+
+def render_product_search(filtered_data, filtered_comparison):
+    st.header("Product Search")
+    search_term = st.text_input("Search for product (separate terms with commas): ", "")
+    terms = [t.strip().lower() for t in search_term.split(',') if t.strip()]
+    if terms:
+        # All terms are matched in a single regex pass over the column
+        pattern = '|'.join(map(re.escape, terms))
+        search_results = filtered_data.loc[
+            filtered_data['_search_blob'].str.contains(pattern, regex=True, na=False),
+            list(SEARCH_RESULT_COLUMNS)
+        ]
+        if len(search_results) > 0:
+            st.success(f"Found {len(search_results)} products")
+            st.dataframe(
+                search_results,
+                column_config=SEARCH_RESULT_COLUMNS,
+                use_container_width=True,
+                hide_index=True
+            )
+
+            if len(filtered_comparison) > 0:
+                product_comparisons = filtered_comparison[
+                    filtered_comparison['product_name'].str.contains(pattern, case=False, regex=True, na=False)
+                ]
+                if len(product_comparisons) > 0:
+                    st.header("Price Comparison")
+                    for _, row in product_comparisons.head(5).iterrows():
+                        col1, col2, col3 = st.columns([2, 1, 1])
+                        with col1:
+                            st.write(f"**{row['product_name']}**")
+                            weight_str = f"{row['weight_grams']:.0f}g" if pd.notna(row['weight_grams']) else "N/A"
+                            st.caption(f"{row['brand']} • {weight_str}")
+                        with col2:
+                            st.metric(label=row['platform_1'], value=f"₹{row['price_1']:.2f}")
+                        with col3:
+                            st.metric(label=row['platform_2'], value=f"₹{row['price_2']:.2f}", delta=f"₹{row['price_diff']:.2f}") 
+                        st.markdown("---")
+        else:
+            st.warning("No products found matching your search")
+
+def render_platform_summary(data):
+    st.header("Platform Summary")
+    st.dataframe(
+        data['platform_summary'],
+        column_config=PLATFORM_SUMMARY_COLUMNS,
+        use_container_width=True,
+        hide_index=True
+    ) 
+    st.subheader("Brand Summary")
+    st.dataframe(
+        data["brand_summary"].head(20),
+        column_config=BRAND_SUMMARY_COLUMNS,
+        use_container_width=True,
+        hide_index=True
+    )
+
 def main():
     st.title("Q-Commerce Price Comparison Dashboard")
     st.markdown("### Compare prices across Zepto, JioMart, Amazon Fresh")
@@ -289,32 +765,27 @@ def main():
 
     if run_scrape or run_prep or refresh:
         st.cache_data.clear()
+        st.session_state.pop('filtered', None)
 
 
 
-    available_platforms = sorted(data['processed']['platform'].unique().tolist())
-    selected_platforms = st.sidebar.multiselect("Select Platform(s)", options=available_platforms, default=available_platforms)
+    selected_platforms = st.sidebar.multiselect("Select Platform(s)", options=data['platforms'], default=data['platforms'])
 
-    available_brands = sorted(data['processed']['brand'].unique().tolist())
-    selected_brands = st.sidebar.multiselect("Select Brand(s)", options=available_brands, default=[])
+    selected_brands = st.sidebar.multiselect("Select Brand(s)", options=data['brands'], default=[])
 
-    min_price = float(data['processed']['price_rupees'].min())
-    max_price = float(data['processed']['price_rupees'].max())
+    min_price = data['price_min']
+    max_price = data['price_max']
     price_range = st.sidebar.slider("Select Price Range (₹)", min_value=min_price, max_value=max_price, value=(min_price, max_price))
 
-    filtered_data = data['processed'].copy()
-
-    if selected_platforms and len(selected_platforms) > 0:
-        filtered_data = filtered_data[filtered_data['platform'].isin(selected_platforms)]
-
-    if selected_brands and len(selected_brands) > 0:
-        filtered_data = filtered_data[filtered_data['brand'].isin(selected_brands)]
-
-    filtered_data = filtered_data[(filtered_data['price_rupees'] >= price_range[0]) & (filtered_data['price_rupees'] <= price_range[1])]
-
-    filtered_comparison = data['comparison'].copy()
-    if selected_platforms and len(selected_platforms) > 0:
-        filtered_comparison = filtered_comparison[(filtered_comparison['platform_1'].isin(selected_platforms)) & (filtered_comparison['platform_2'].isin(selected_platforms))]
+    filter_key = (tuple(sorted(selected_platforms)), tuple(sorted(selected_brands)), tuple(price_range))
+    # st.cache_data hands back a fresh copy of both frames on every hit; reruns that
+    # leave the filters alone (view switches, search typing) reuse the previous pair
+    cached = st.session_state.get('filtered')
+    if cached is not None and cached[0] == filter_key:
+        _, filtered_data, filtered_comparison = cached
+    else:
+        filtered_data, filtered_comparison = filter_data(*filter_key)
+        st.session_state['filtered'] = (filter_key, filtered_data, filtered_comparison)
 
     st.markdown("---")
     col1, col2, col3, col4 = st.columns(4)
@@ -338,175 +809,20 @@ def main():
         total_saving = filtered_comparison['savings'].sum() if not filtered_comparison.empty else 0
         st.metric(label="Total Savings (₹)", value=f"₹{total_saving:,.2f}")
 
-    tab1, tab2, tab3, tab4, tab5 = st.tabs(["Overview", "Best Deal", "Price Analysis", "Product Search", "Platform Summary"])
-
-    with tab1:
-        st.header("Market Overview")
-        col1, col2 = st.columns(2)
-        with col1:
-            st.plotly_chart(create_price_distribution(filtered_data, selected_platforms), use_container_width=True)
-        with col2:
-            st.plotly_chart(create_unit_price_comparison(filtered_data, selected_platforms), use_container_width=True)
-        st.plotly_chart(create_brand_analysis(filtered_data), use_container_width=True)
-        if len(filtered_comparison) > 0:
-            st.plotly_chart(create_platform_comparison_matrix(filtered_comparison), use_container_width=True)
-
-    with tab2:
-        st.header("Best Deals and Savings")
-        if len(filtered_comparison) > 0:
-            st.plotly_chart(create_savings_chart(filtered_comparison), use_container_width=True)
-            st.subheader("Top 10 Deals")
-            top_deals = filtered_comparison.nlargest(min(10, len(filtered_comparison)), 'savings')[
-                ['product_name', 'brand', 'weight_grams', 'platform_1', 'price_1', 'platform_2', 'price_2', 'cheaper_platform', 'best_price', 'savings']
-            ].copy()
-            top_deals['weight_grams'] = top_deals['weight_grams'].apply(
-                lambda x: f"{x:.0f}g" if pd.notna(x) else "N/A"
-            )
-            top_deals['price_1'] = top_deals['price_1'].apply(lambda x: f"₹{x:.2f}")
-            top_deals['price_2'] = top_deals['price_2'].apply(lambda x: f"₹{x:.2f}")
-            top_deals['best_price'] = top_deals['best_price'].apply(lambda x: f"₹{x:.2f}")
-            top_deals['savings'] = top_deals['savings'].apply(lambda x: f"₹{x:.2f}")
-            top_deals.columns = ['Product', 'Brand', 'Weight', 'Platform 1', 'Price 1', 'Platform 2', 'Price 2', 'Cheaper On', 'Best Price', 'Save']
-
-            st.dataframe(top_deals, use_container_width=True, hide_index=True)
-        else:
-            st.info("No matched products found with current filters")
-    
-    with tab3:
-        st.header("Detailed Price Analysis")
-        if len(selected_brands) > 0:
-            brand_filtered = filtered_data[filtered_data['brand_clean'].isin(selected_brands)]
-        else:
-            brand_filtered = filtered_data
-        
-        scatter_data = brand_filtered[
-            brand_filtered['weight_grams'].notna() &
-            brand_filtered['price_per_100g'].notna()
-        ].copy()
-
-        if len(scatter_data) > 0:
-            fig = px.scatter(
-                scatter_data,
-                x='weight_grams',
-                y='price_rupees',
-                color='platform',
-                size='price_per_100g',
-                hover_data=['product_name', 'brand_clean'],
-                title="Price vs Weight Analysis",
-                labels={'weight_grams': 'Weight (g)', 'price_rupees': 'Price (₹)'},
-            )
-            fig.update_layout(height=500)
-            st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.info("No data available for scatter plot with current filters")
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            if len(filtered_data) > 0:
-                platform_avg = filtered_data.groupby('platform')['price_rupees'].agg(
-                    ['mean', 'median', 'std']
-                ).reset_index()
-                platform_avg.columns = ['Platform', 'Mean Price', 'Median Price', 'Std Dev']
-
-                st.subheader("Platform Statistics")
-                st.dataframe(
-                    platform_avg.style.format({
-                        'Mean Price': '₹{:.2f}',
-                        'Median Price': '₹{:.2f}',
-                        'Std Dev': '₹{:.2f}'
-                    }), use_container_width=True, hide_index=True
-                )
-        with col2:
-            if len(filtered_comparison) > 0:
-                platform_wins = filtered_comparison['cheaper_platform'].value_counts().reset_index()
-                platform_wins.columns = ['Platform', 'Times Cheapest']
-
-                fig = px.pie(
-                    platform_wins,
-                    values='Times Cheapest',
-                    names='Platform',
-                    title="Which Platform Offers Best Price Most Often?"
-                )
-
-                st.plotly_chart(fig, use_container_width=True)
-
-    with tab4:
-        st.header("Product Search")
-        search_term = st.text_input("Search for product: ", "")
-        if search_term:
-            search_results = filtered_data[
-                filtered_data['product_name'].str.contains(search_term, case=False, na=False) |
-                filtered_data['brand_clean'].str.contains(search_term, case=False, na=False)
-            ].copy()
-            if len(search_results) > 0:
-                st.success(f"Found {len(search_results)} products")
-                display_cols = ['platform', 'product_name', 'brand_clean', 'weight_grams', 'price_rupees', 'price_per_100g']
-                search_results_display = search_results[display_cols].copy()
-                search_results_display['weight_grams'] = search_results_display['weight_grams'].apply(
-                    lambda x: f"{x:.0f}g" if pd.notna(x) else "N/A"
-                )
-                search_results_display['price_rupees'] = search_results_display['price_rupees'].apply(
-                    lambda x: f"₹{x:.2f}"
-                )
-                search_results_display['price_per_100g'] = search_results_display['price_per_100g'].apply(
-                    lambda x: f"₹{x:.2f}" if pd.notna(x) else "N/A"
-                )
-                search_results_display.columns = ['Platform', 'Product', 'Brand', 'Weight', 'Price', 'Price/100g']
-                
-                st.dataframe(
-                    search_results_display,
-                    use_container_width=True,
-                    hide_index=True
-                )
-
-                if len(filtered_comparison) > 0:
-                    product_comparisons = filtered_comparison[
-                        filtered_comparison['product_name'].str.contains(search_term, case=False, na=False)
-                    ]
-                    if len(product_comparisons) > 0:
-                        st.header("Price Comparison")
-                        for _, row in product_comparisons.head(5).iterrows():
-                            col1, col2, col3 = st.columns([2, 1, 1])
-                            with col1:
-                                st.write(f"**{row['product_name']}**")
-                                weight_str = f"{row['weight_grams']:.0f}g" if pd.notna(row['weight_grams']) else "N/A"
-                                st.caption(f"{row['brand']} • {weight_str}")
-                            with col2:
-                                st.metric(label=row['platform_1'], value=f"₹{row['price_1']:.2f}")
-                            with col3:
-                                st.metric(label=row['platform_2'], value=f"₹{row['price_2']:.2f}", delta=f"₹{row['price_diff']:.2f}") 
-                            st.markdown("---")
-            else:
-                st.warning("No products found matching your search")
-
-    with tab5:
-        st.header("Platform Summary")
-        summary_data = data['platform_summary'].copy()
-        st.dataframe(
-            summary_data.style.format({
-                'total_products': '{:,.0f}',
-                'avg_price': '₹{:.2f}',
-                'median_price': '₹{:.2f}',
-                'min_price': '₹{:.2f}',
-                'max_price': '₹{:.2f}',
-                'avg_price_per_100g': '₹{:.2f}',
-                'median_price_per_100g': '₹{:.2f}'
-            }),
-            use_container_width=True,
-            hide_index=True
-        ) 
-        st.subheader("Brand Summary")
-        brand_data = data["brand_summary"].head(20).copy()
-        st.dataframe(
-            brand_data.style.format({
-                'product_count': '{:,.0f}',
-                'platforms_available': '{:,.0f}',
-                'avg_price': '₹{:.2f}',
-                'avg_price_per_100g': '₹{:.2f}'
-            }),
-            use_container_width=True,
-            hide_index=True
-        ) 
+    views = ["Overview", "Best Deal", "Price Analysis", "Product Search", "Platform Summary"]
+    active_view = st.radio("View", options=views, horizontal=True, key="active_view")
+
+    # Only the selected view is rendered, so a rerun never rebuilds hidden views
+    if active_view == "Overview":
+        render_overview(filter_key, filtered_comparison)
+    elif active_view == "Best Deal":
+        render_best_deals(filter_key, filtered_comparison)
+    elif active_view == "Price Analysis":
+        render_price_analysis(filter_key, filtered_data, filtered_comparison)
+    elif active_view == "Product Search":
+        render_product_search(filtered_data, filtered_comparison)
+    else:
+        render_platform_summary(data)
 
     st.markdown("---")
     st.markdown("""